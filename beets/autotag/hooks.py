@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import re
 from collections import namedtuple
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from typing import (
     Any,
     Callable,
@@ -338,6 +338,42 @@ SD_REPLACE = [
 ]
 
 
+@lru_cache(maxsize=4096)
+def _normalize_basic(string: str) -> str:
+    """Transliterate `string` to lowercase ASCII and drop everything
+    that is not alphanumeric. Cached since the same titles are compared
+    against many others during matching.
+    """
+    return re.sub(r"[^a-z0-9]", "", as_string(unidecode(string)).lower())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_string(string: str) -> str:
+    """Apply the case folding and word-level normalization used by
+    `string_dist` to a single string.
+    """
+    string = string.lower()
+
+    # Don't penalize strings that move certain words to the end. For
+    # example, "the something" should be considered equal to
+    # "something, the".
+    for word in SD_END_WORDS:
+        if string.endswith(", %s" % word):
+            string = "{} {}".format(word, string[: -len(word) - 2])
+
+    # Perform a couple of basic normalizing substitutions.
+    for pat, repl in SD_REPLACE:
+        string = re.sub(pat, repl, string)
+
+    return string
+
+
+@lru_cache(maxsize=4096)
+def _drop_pattern(pat: str, string: str) -> str:
+    """Remove all matches of the regular expression `pat` from `string`."""
+    return re.sub(pat, "", string)
+
+
 def _string_dist_basic(str1: str, str2: str) -> float:
     """Basic edit distance between two strings, ignoring
     non-alphanumeric characters and case. Comparisons are based on a
@@ -346,10 +382,8 @@ def _string_dist_basic(str1: str, str2: str) -> float:
     """
     assert isinstance(str1, str)
     assert isinstance(str2, str)
-    str1 = as_string(unidecode(str1))
-    str2 = as_string(unidecode(str2))
-    str1 = re.sub(r"[^a-z0-9]", "", str1.lower())
-    str2 = re.sub(r"[^a-z0-9]", "", str2.lower())
+    str1 = _normalize_basic(str1)
+    str2 = _normalize_basic(str2)
     if not str1 and not str2:
         return 0.0
     return levenshtein_distance(str1, str2) / float(max(len(str1), len(str2)))
@@ -365,22 +399,8 @@ def string_dist(str1: Optional[str], str2: Optional[str]) -> float:
     if str1 is None or str2 is None:
         return 1.0
 
-    str1 = str1.lower()
-    str2 = str2.lower()
-
-    # Don't penalize strings that move certain words to the end. For
-    # example, "the something" should be considered equal to
-    # "something, the".
-    for word in SD_END_WORDS:
-        if str1.endswith(", %s" % word):
-            str1 = "{} {}".format(word, str1[: -len(word) - 2])
-        if str2.endswith(", %s" % word):
-            str2 = "{} {}".format(word, str2[: -len(word) - 2])
-
-    # Perform a couple of basic normalizing substitutions.
-    for pat, repl in SD_REPLACE:
-        str1 = re.sub(pat, repl, str1)
-        str2 = re.sub(pat, repl, str2)
+    str1 = _normalize_string(str1)
+    str2 = _normalize_string(str2)
 
     # Change the weight for certain string portions matched by a set
     # of regular expressions. We gradually change the strings and build
@@ -390,8 +410,8 @@ def string_dist(str1: Optional[str], str2: Optional[str]) -> float:
     penalty = 0.0
     for pat, weight in SD_PATTERNS:
         # Get strings that drop the pattern.
-        case_str1 = re.sub(pat, "", str1)
-        case_str2 = re.sub(pat, "", str2)
+        case_str1 = _drop_pattern(pat, str1)
+        case_str2 = _drop_pattern(pat, str2)
 
         if case_str1 != str1 or case_str2 != str2:
             # If the pattern was present (i.e., it is deleted in the
@@ -18,8 +18,11 @@ releases and tracks.
 
 
 import datetime
+import heapq
 import re
-from collections import namedtuple
+from collections import Counter, namedtuple
+from functools import lru_cache
+from operator import itemgetter
 from typing import (
     Any,
     Dict,
@@ -45,14 +48,35 @@ from beets.autotag import (
     hooks,
 )
 from beets.library import Item
-from beets.util import plurality
 from beets.util.enumeration import OrderedEnum
 
 # Artist signals that indicate "various artists". These are used at the
 # album level to determine whether a given release is likely a VA
 # release and also on the track level to to remove the penalty for
 # differing artists.
-VA_ARTISTS = ("", "various artists", "various", "va", "unknown")
+VA_ARTISTS = frozenset(("", "various artists", "various", "va", "unknown"))
+
+# Above this number of items or tracks, the exact (cubic) assignment
+# solver takes seconds per candidate and an approximation is used
+# instead.
+MAX_EXACT_ASSIGNMENT_SIZE = 300
+
+# Fields used to determine the likely current metadata of an album.
+CURRENT_METADATA_FIELDS = (
+    "artist",
+    "album",
+    "albumartist",
+    "year",
+    "disctotal",
+    "mb_albumid",
+    "label",
+    "barcode",
+    "catalognum",
+    "country",
+    "media",
+    "albumdisambig",
+)
+_get_current_metadata_fields = itemgetter(*CURRENT_METADATA_FIELDS)
 
 # Global logger.
 log = logging.getLogger("beets")
@@ -72,6 +96,15 @@ class Recommendation(OrderedEnum):
     strong = 3
 
 
+# Recommendation names as used in the configuration.
+RECOMMENDATION_CHOICES = {
+    "strong": Recommendation.strong,
+    "medium": Recommendation.medium,
+    "low": Recommendation.low,
+    "none": Recommendation.none,
+}
+
+
 # A structure for holding a set of possible matches to choose between. This
 # consists of a list of possible candidates (i.e., AlbumInfo or TrackInfo
 # objects) and a recommendation value.
@@ -79,6 +112,121 @@ class Recommendation(OrderedEnum):
 Proposal = namedtuple("Proposal", ("candidates", "recommendation"))
 
 
+# Cached configuration. The matching options are read-only while
+# tagging, but looking them up through the configuration views is slow
+# enough to matter on the hot path, so they are computed once.
+# `_reset_config_cache` must be called after changing them.
+
+
+@lru_cache(maxsize=None)
+def _preferred_media_patterns() -> Tuple["re.Pattern[str]", ...]:
+    """Compiled regular expressions for the preferred media, in order
+    of preference.
+    """
+    patterns = cast(
+        Sequence[str], config["match"]["preferred"]["media"].as_str_seq()
+    )
+    return tuple(re.compile(r"(\d+x)?(%s)" % pat, re.I) for pat in patterns)
+
+
+@lru_cache(maxsize=None)
+def _preferred_country_patterns() -> Tuple["re.Pattern[str]", ...]:
+    """Compiled regular expressions for the preferred countries, in
+    order of preference.
+    """
+    patterns = cast(
+        Sequence[str], config["match"]["preferred"]["countries"].as_str_seq()
+    )
+    return tuple(re.compile(pat, re.I) for pat in patterns)
+
+
+@lru_cache(maxsize=None)
+def _prefer_original_year() -> bool:
+    """Whether releases closer to the original release year are
+    preferred.
+    """
+    return bool(config["match"]["preferred"]["original_year"].get())
+
+
+@lru_cache(maxsize=None)
+def _track_length_grace() -> Union[float, int]:
+    return cast(
+        Union[float, int], config["match"]["track_length_grace"].as_number()
+    )
+
+
+@lru_cache(maxsize=None)
+def _track_length_max() -> Union[float, int]:
+    return cast(
+        Union[float, int], config["match"]["track_length_max"].as_number()
+    )
+
+
+@lru_cache(maxsize=None)
+def _strong_rec_thresh() -> Union[float, int]:
+    return cast(
+        Union[float, int], config["match"]["strong_rec_thresh"].as_number()
+    )
+
+
+@lru_cache(maxsize=None)
+def _medium_rec_thresh() -> Union[float, int]:
+    return cast(
+        Union[float, int], config["match"]["medium_rec_thresh"].as_number()
+    )
+
+
+@lru_cache(maxsize=None)
+def _rec_gap_thresh() -> Union[float, int]:
+    return cast(
+        Union[float, int], config["match"]["rec_gap_thresh"].as_number()
+    )
+
+
+@lru_cache(maxsize=None)
+def _required_tags() -> Tuple[str, ...]:
+    """Tags that a candidate must have to be considered at all."""
+    return tuple(config["match"]["required"].as_str_seq())
+
+
+@lru_cache(maxsize=None)
+def _ignored_penalties() -> Tuple[str, ...]:
+    """Penalties that disqualify a candidate when applied."""
+    return tuple(config["match"]["ignored"].as_str_seq())
+
+
+@lru_cache(maxsize=None)
+def _max_rec(key: str) -> Optional[Recommendation]:
+    """The configured maximum recommendation for the penalty `key`, or
+    None if it has none. Values are only parsed for penalties that are
+    actually applied.
+    """
+    max_rec_view = config["match"]["max_rec"]
+    if key not in max_rec_view.keys():
+        return None
+    return max_rec_view[key].as_choice(RECOMMENDATION_CHOICES)
+
+
+def _reset_config_cache():
+    """Forget all cached configuration values so they are read again on
+    next use.
+    """
+    for func in (
+        _preferred_media_patterns,
+        _preferred_country_patterns,
+        _prefer_original_year,
+        _track_length_grace,
+        _track_length_max,
+        _strong_rec_thresh,
+        _medium_rec_thresh,
+        _rec_gap_thresh,
+        _required_tags,
+        _ignored_penalties,
+        _max_rec,
+    ):
+        func.cache_clear()
+
+
 # Primary matching functionality.
 
 
@@ -92,26 +240,24 @@ def current_metadata(
     """
     assert items  # Must be nonempty.
 
+    # Count the values of all fields in a single pass over the items.
+    counters: List["Counter[Any]"] = [
+        Counter() for _ in CURRENT_METADATA_FIELDS
+    ]
+    num_items = 0
+    for item in items:
+        if not item:
+            continue
+        num_items += 1
+        values = _get_current_metadata_fields(item)
+        for counter, value in zip(counters, values):
+            counter[value] += 1
+
     likelies = {}
     consensus = {}
-    fields = [
-        "artist",
-        "album",
-        "albumartist",
-        "year",
-        "disctotal",
-        "mb_albumid",
-        "label",
-        "barcode",
-        "catalognum",
-        "country",
-        "media",
-        "albumdisambig",
-    ]
-    for field in fields:
-        values = [item[field] for item in items if item]
-        likelies[field], freq = plurality(values)
-        consensus[field] = freq == len(values)
+    for field, counter in zip(CURRENT_METADATA_FIELDS, counters):
+        likelies[field], freq = counter.most_common(1)[0]
+        consensus[field] = freq == num_items
 
     # If there's an album artist consensus, use this for the artist.
     if consensus["albumartist"] and likelies["albumartist"]:
@@ -120,34 +266,220 @@ def current_metadata(
     return likelies, consensus
 
 
+def _build_cost_matrix(
+    items: Sequence[Item],
+    tracks: Sequence[TrackInfo],
+    cache: Optional[Dict[Tuple[Any, ...], float]] = None,
+) -> List[List[float]]:
+    """Compute the matrix of track distances between every item (rows)
+    and every track (columns).
+
+    The cells are plain floats rather than `Distance` objects: the
+    matching algorithm does a lot of arithmetic and comparisons on the
+    costs, and each of those would otherwise recompute the weighted
+    distance from scratch.
+
+    This computes the same distance as `track_distance` (without the
+    artist component), but fetches the relevant fields of each track
+    and item only once instead of once per pair, and sums the weighted
+    penalties directly instead of collecting them in a `Distance`. The
+    full breakdown is only needed for the pairs that end up matched,
+    which `distance` computes with `track_distance`.
+
+    `cache` may be a dictionary shared between calls for the same
+    `items`. Candidate releases often contain identical tracks, and
+    their distances are then looked up instead of computed again.
+    """
+    track_length_grace = _track_length_grace()
+    track_length_max = _track_length_max()
+    weights = hooks.Distance._weights
+    length_weight = weights["track_length"]
+    title_weight = weights["track_title"]
+    index_weight = weights["track_index"]
+    id_weight = weights["track_id"]
+    plugin_penalties = plugins.has_track_distance()
+    track_fields = [
+        (t.length, t.title, t.index, t.medium_index, t.track_id) for t in tracks
+    ]
+
+    costs = []
+    for i, item in enumerate(items):
+        item_length = cast(float, item.length)
+        item_title = item.title
+        item_track = item.track
+        item_trackid = item.mb_trackid
+
+        row = []
+        for track, fields in zip(tracks, track_fields):
+            # Plugin penalties may use any key and depend on anything,
+            # so leave those pairs to the full implementation.
+            if plugin_penalties:
+                plugin_dist = plugins.track_distance(item, track)
+                if plugin_dist.max_distance:
+                    dist = _track_distance_without_plugins(item, track)
+                    dist.update(plugin_dist)
+                    row.append(dist.distance)
+                    continue
+            if cache is not None and (i, fields) in cache:
+                row.append(cache[i, fields])
+                continue
+
+            # Accumulate the weighted penalties in the same order as
+            # `track_distance` so the result is exactly the same.
+            length, title, index, medium_index, track_id = fields
+            dist_raw = 0.0
+            dist_max = 0.0
+            if length:
+                diff = abs(item_length - length) - track_length_grace
+                if track_length_max:
+                    ratio = max(min(diff, track_length_max), 0)
+                    dist_raw += float(ratio) / track_length_max * length_weight
+                dist_max += length_weight
+            dist_raw += hooks.string_dist(item_title, title) * title_weight
+            dist_max += title_weight
+            if index and item_track:
+                if item_track not in (medium_index, index):
+                    dist_raw += index_weight
+                dist_max += index_weight
+            if item_trackid:
+                if item_trackid != track_id:
+                    dist_raw += id_weight
+                dist_max += id_weight
+
+            cost = dist_raw / dist_max if dist_max else 0.0
+            if cache is not None:
+                cache[i, fields] = cost
+            row.append(cost)
+        costs.append(row)
+    return costs
+
+
+def _greedy_assignment(costs: List[List[float]]) -> List[Tuple[int, int]]:
+    """Approximate a minimum-cost bipartite matching for the cost matrix
+    `costs`. Returns a list of (row, column) pairs.
+
+    The cheapest pair whose row and column are both still free is
+    picked repeatedly, then the result is improved by exchanging the
+    columns of two pairs, or moving a pair to a free row or column,
+    until no such change lowers the total cost. The result is usually
+    optimal or very close to it, but this is not guaranteed.
+    """
+    cells = sorted(
+        (cost, i, j)
+        for i, row in enumerate(costs)
+        for j, cost in enumerate(row)
+    )
+    size = min(len(costs), len(costs[0]) if costs else 0)
+    used_rows = set()
+    used_cols = set()
+    matching = []
+    for _, i, j in cells:
+        if i in used_rows or j in used_cols:
+            continue
+        used_rows.add(i)
+        used_cols.add(j)
+        matching.append((i, j))
+        if len(matching) == size:
+            break
+
+    free_rows = [i for i in range(len(costs)) if i not in used_rows]
+    free_cols = [
+        j for j in range(len(costs[0]) if costs else 0) if j not in used_cols
+    ]
+    improved = True
+    while improved:
+        improved = False
+        for a in range(len(matching)):
+            i, j = matching[a]
+            for b in range(a + 1, len(matching)):
+                k, m = matching[b]
+                if costs[i][m] + costs[k][j] < costs[i][j] + costs[k][m]:
+                    matching[a] = (i, m)
+                    matching[b] = (k, j)
+                    j = m
+                    improved = True
+            for f, m in enumerate(free_cols):
+                if costs[i][m] < costs[i][j]:
+                    free_cols[f] = j
+                    matching[a] = (i, m)
+                    j = m
+                    improved = True
+            for f, k in enumerate(free_rows):
+                if costs[k][j] < costs[i][j]:
+                    free_rows[f] = i
+                    matching[a] = (k, j)
+                    i = k
+                    improved = True
+    return matching
+
+
+def _aligned_mapping(
+    items: Sequence[Item],
+    tracks: Sequence[TrackInfo],
+) -> Optional[Dict[Item, TrackInfo]]:
+    """If the items correspond one-to-one with the tracks, in track
+    number order, and every such pair has a track distance of zero,
+    return that mapping. Since distances are never negative, it is then
+    an optimal assignment. Otherwise, return None.
+    """
+    if len(items) != len(tracks):
+        return None
+    # Plugin penalties could make the aligned pairs more expensive.
+    if plugins.has_track_distance():
+        return None
+
+    track_length_grace = _track_length_grace()
+    sorted_items = sorted(items, key=lambda i: (i.disc, i.track))
+    sorted_tracks = sorted(tracks, key=lambda t: t.index or 0)
+    for item, track in zip(sorted_items, sorted_tracks):
+        if (
+            not track.title
+            or item.title.lower() != track.title.lower()
+            or track_index_changed(item, track)
+            or (
+                track.length
+                and abs(item.length - track.length) > track_length_grace
+            )
+            or (item.mb_trackid and item.mb_trackid != track.track_id)
+        ):
+            return None
+    return dict(zip(sorted_items, sorted_tracks))
+
+
 def assign_items(
     items: Sequence[Item],
     tracks: Sequence[TrackInfo],
+    cache: Optional[Dict[Tuple[Any, ...], float]] = None,
 ) -> Tuple[Dict[Item, TrackInfo], List[Item], List[TrackInfo]]:
     """Given a list of Items and a list of TrackInfo objects, find the
     best mapping between them. Returns a mapping from Items to TrackInfo
     objects, a set of extra Items, and a set of extra TrackInfo
     objects. These "extra" objects occur when there is an unequal number
-    of objects of the two types.
+    of objects of the two types. `cache` may be shared between calls
+    with the same `items` to reuse track distances.
     """
-    # Construct the cost matrix.
-    costs: List[List[Distance]] = []
-    for item in items:
-        row = []
-        for track in tracks:
-            row.append(track_distance(item, track))
-        costs.append(row)
+    # If the items are already tagged like the tracks, there is nothing
+    # to solve.
+    mapping = _aligned_mapping(items, tracks)
+    if mapping is None:
+        # Construct the cost matrix.
+        costs = _build_cost_matrix(items, tracks, cache)
+
+        # Find a minimum-cost bipartite matching.
+        log.debug("Computing track assignment...")
+        if max(len(items), len(tracks)) > MAX_EXACT_ASSIGNMENT_SIZE:
+            matching = _greedy_assignment(costs)
+        else:
+            matching = Munkres().compute(costs)
+        log.debug("...done.")
 
-    # Find a minimum-cost bipartite matching.
-    log.debug("Computing track assignment...")
-    matching = Munkres().compute(costs)
-    log.debug("...done.")
+        # Produce the output matching.
+        mapping = {items[i]: tracks[j] for (i, j) in matching}
 
-    # Produce the output matching.
-    mapping = {items[i]: tracks[j] for (i, j) in matching}
-    extra_items = list(set(items) - set(mapping.keys()))
+    extra_items = [item for item in items if item not in mapping]
     extra_items.sort(key=lambda i: (i.disc, i.track, i.title))
-    extra_tracks = list(set(tracks) - set(mapping.values()))
+    matched_tracks = set(mapping.values())
+    extra_tracks = [track for track in tracks if track not in matched_tracks]
     extra_tracks.sort(key=lambda t: (t.index, t.title))
     return mapping, extra_items, extra_tracks
 
@@ -168,22 +500,28 @@ def track_distance(
     Distance object. `incl_artist` indicates that a distance component should
     be included for the track artist (i.e., for various-artist releases).
     """
+    dist = _track_distance_without_plugins(item, track_info, incl_artist)
+
+    # Plugins.
+    if plugins.has_track_distance():
+        dist.update(plugins.track_distance(item, track_info))
+
+    return dist
+
+
+def _track_distance_without_plugins(
+    item: Item,
+    track_info: TrackInfo,
+    incl_artist: bool = False,
+) -> Distance:
+    """Like `track_distance`, but without the plugin penalties."""
     dist = hooks.Distance()
 
     # Length.
     if track_info.length:
         item_length = cast(float, item.length)
-        track_length_grace = cast(
-            Union[float, int],
-            config["match"]["track_length_grace"].as_number(),
-        )
-        track_length_max = cast(
-            Union[float, int],
-            config["match"]["track_length_max"].as_number(),
-        )
-
-        diff = abs(item_length - track_info.length) - track_length_grace
-        dist.add_ratio("track_length", diff, track_length_max)
+        diff = abs(item_length - track_info.length) - _track_length_grace()
+        dist.add_ratio("track_length", diff, _track_length_max())
 
     # Title.
     dist.add_string("track_title", item.title, track_info.title)
@@ -204,9 +542,6 @@ def track_distance(
     if item.mb_trackid:
         dist.add_expr("track_id", item.mb_trackid != track_info.track_id)
 
-    # Plugins.
-    dist.update(plugins.track_distance(item, track_info))
-
     return dist
 
 
@@ -214,6 +549,7 @@ def distance(
     items: Sequence[Item],
     album_info: AlbumInfo,
     mapping: Dict[Item, TrackInfo],
+    likelies: Optional[Dict[str, Any]] = None,
 ) -> Distance:
     """Determines how "significant" an album metadata change would be.
     Returns a Distance object. `album_info` is an AlbumInfo object
@@ -221,9 +557,12 @@ def distance(
     Item objects that will be matched (order is not important).
     `mapping` is a dictionary mapping Items to TrackInfo objects; the
     keys are a subset of `items` and the values are a subset of
-    `album_info.tracks`.
+    `album_info.tracks`. `likelies` may hold the result of
+    `current_metadata(items)` to avoid computing it again for every
+    candidate.
     """
-    likelies, _ = current_metadata(items)
+    if likelies is None:
+        likelies, _ = current_metadata(items)
 
     dist = hooks.Distance()
 
@@ -237,9 +576,7 @@ def distance(
     # Current or preferred media.
     if album_info.media:
         # Preferred media options.
-        patterns = config["match"]["preferred"]["media"].as_str_seq()
-        patterns = cast(Sequence[str], patterns)
-        options = [re.compile(r"(\d+x)?(%s)" % pat, re.I) for pat in patterns]
+        options = _preferred_media_patterns()
         if options:
             dist.add_priority("media", album_info.media, options)
         # Current media.
@@ -251,7 +588,7 @@ def distance(
         dist.add_number("mediums", likelies["disctotal"], album_info.mediums)
 
     # Prefer earliest release.
-    if album_info.year and config["match"]["preferred"]["original_year"]:
+    if album_info.year and _prefer_original_year():
         # Assume 1889 (earliest first gramophone discs) if we don't know the
         # original year.
         original = album_info.original_year or 1889
@@ -275,9 +612,7 @@ def distance(
             dist.add("year", 1.0)
 
     # Preferred countries.
-    patterns = config["match"]["preferred"]["countries"].as_str_seq()
-    patterns = cast(Sequence[str], patterns)
-    options = [re.compile(pat, re.I) for pat in patterns]
+    options = _preferred_country_patterns()
     if album_info.country and options:
         dist.add_priority("country", album_info.country, options)
     # Country.
@@ -321,7 +656,8 @@ def distance(
         dist.add("unmatched_tracks", 1.0)
 
     # Plugins.
-    dist.update(plugins.album_distance(items, album_info, mapping))
+    if plugins.has_album_distance():
+        dist.update(plugins.album_distance(items, album_info, mapping))
 
     return dist
 
@@ -331,23 +667,22 @@ def match_by_id(items: Iterable[Item]):
     AlbumInfo object for the corresponding album. Otherwise, returns
     None.
     """
-    albumids = (item.mb_albumid for item in items if item.mb_albumid)
+    albumids = {item.mb_albumid for item in items if item.mb_albumid}
 
     # Did any of the items have an MB album ID?
-    try:
-        first = next(albumids)
-    except StopIteration:
+    if not albumids:
         log.debug("No album ID found.")
         return None
 
     # Is there a consensus on the MB album ID?
-    for other in albumids:
-        if other != first:
-            log.debug("No album ID consensus.")
-            return None
+    if len(albumids) > 1:
+        log.debug("No album ID consensus.")
+        return None
+    (albumid,) = albumids
+
     # If all album IDs are equal, look up the album.
-    log.debug("Searching for discovered album ID: {0}", first)
-    return hooks.album_for_mbid(first)
+    log.debug("Searching for discovered album ID: {0}", albumid)
+    return hooks.album_for_mbid(albumid)
 
 
 def _recommendation(
@@ -366,19 +701,16 @@ def _recommendation(
 
     # Basic distance thresholding.
     min_dist = results[0].distance
-    if min_dist < config["match"]["strong_rec_thresh"].as_number():
+    if min_dist < _strong_rec_thresh():
         # Strong recommendation level.
         rec = Recommendation.strong
-    elif min_dist <= config["match"]["medium_rec_thresh"].as_number():
+    elif min_dist <= _medium_rec_thresh():
         # Medium recommendation level.
         rec = Recommendation.medium
     elif len(results) == 1:
         # Only a single candidate.
         rec = Recommendation.low
-    elif (
-        results[1].distance - min_dist
-        >= config["match"]["rec_gap_thresh"].as_number()
-    ):
+    elif results[1].distance - min_dist >= _rec_gap_thresh():
         # Gap between first two candidates is large.
         rec = Recommendation.low
     else:
@@ -390,18 +722,10 @@ def _recommendation(
     keys = set(min_dist.keys())
     if isinstance(results[0], hooks.AlbumMatch):
         for track_dist in min_dist.tracks.values():
-            keys.update(list(track_dist.keys()))
-    max_rec_view = config["match"]["max_rec"]
+            keys.update(track_dist.keys())
     for key in keys:
-        if key in list(max_rec_view.keys()):
-            max_rec = max_rec_view[key].as_choice(
-                {
-                    "strong": Recommendation.strong,
-                    "medium": Recommendation.medium,
-                    "low": Recommendation.low,
-                    "none": Recommendation.none,
-                }
-            )
+        max_rec = _max_rec(key)
+        if max_rec is not None:
             rec = min(rec, max_rec)
 
     return rec
@@ -415,57 +739,80 @@ def _sort_candidates(candidates: Iterable[AnyMatch]) -> Sequence[AnyMatch]:
     return sorted(candidates, key=lambda match: match.distance)
 
 
-def _add_candidate(
+def _top_candidates(candidates: Iterable[AnyMatch]) -> Sequence[AnyMatch]:
+    """Return the two candidates with the lowest distance, sorted by
+    distance. This is all `_recommendation` looks at, and is cheaper
+    than sorting all candidates.
+    """
+    return heapq.nsmallest(2, candidates, key=lambda match: match.distance)
+
+
+def _score_candidate(
     items: Sequence[Item],
-    results: Dict[Any, AlbumMatch],
     info: AlbumInfo,
-):
-    """Given a candidate AlbumInfo object, attempt to add the candidate
-    to the output dictionary of AlbumMatch objects. This involves
-    checking the track count, ordering the items, checking for
-    duplicates, and calculating the distance.
+    likelies: Optional[Dict[str, Any]] = None,
+    track_costs: Optional[Dict[Tuple[Any, ...], float]] = None,
+) -> Optional[AlbumMatch]:
+    """Match `items` against a candidate AlbumInfo object and return
+    the resulting AlbumMatch, or None if the candidate is discarded.
+    This involves checking the track count and required tags, ordering
+    the items, and calculating the distance. `likelies` is passed on to
+    `distance` and `track_costs` to `assign_items`.
     """
-    log.debug(
-        "Candidate: {0} - {1} ({2})", info.artist, info.album, info.album_id
-    )
-
     # Discard albums with zero tracks.
     if not info.tracks:
         log.debug("No tracks.")
-        return
-
-    # Prevent duplicates.
-    if info.album_id and info.album_id in results:
-        log.debug("Duplicate.")
-        return
+        return None
 
     # Discard matches without required tags.
-    for req_tag in cast(
-        Sequence[str], config["match"]["required"].as_str_seq()
-    ):
+    for req_tag in _required_tags():
         if getattr(info, req_tag) is None:
             log.debug("Ignored. Missing required tag: {0}", req_tag)
-            return
+            return None
 
     # Find mapping between the items and the track info.
-    mapping, extra_items, extra_tracks = assign_items(items, info.tracks)
+    mapping, extra_items, extra_tracks = assign_items(
+        items, info.tracks, track_costs
+    )
 
     # Get the change distance.
-    dist = distance(items, info, mapping)
+    dist = distance(items, info, mapping, likelies)
 
     # Skip matches with ignored penalties.
-    penalties = [key for key, _ in dist]
-    ignored = cast(Sequence[str], config["match"]["ignored"].as_str_seq())
-    for penalty in ignored:
+    penalties = {key for key, _ in dist}
+    for penalty in _ignored_penalties():
         if penalty in penalties:
             log.debug("Ignored. Penalty: {0}", penalty)
-            return
+            return None
 
     log.debug("Success. Distance: {0}", dist)
-    results[info.album_id] = hooks.AlbumMatch(
-        dist, info, mapping, extra_items, extra_tracks
+    return hooks.AlbumMatch(dist, info, mapping, extra_items, extra_tracks)
+
+
+def _add_candidate(
+    items: Sequence[Item],
+    results: Dict[Any, AlbumMatch],
+    info: AlbumInfo,
+    likelies: Optional[Dict[str, Any]] = None,
+    track_costs: Optional[Dict[Tuple[Any, ...], float]] = None,
+):
+    """Given a candidate AlbumInfo object, attempt to add the candidate
+    to the output dictionary of AlbumMatch objects. Duplicates are
+    skipped; otherwise the candidate is scored by `_score_candidate`.
+    """
+    log.debug(
+        "Candidate: {0} - {1} ({2})", info.artist, info.album, info.album_id
     )
 
+    # Prevent duplicates.
+    if info.album_id and info.album_id in results:
+        log.debug("Duplicate.")
+        return
+
+    album_match = _score_candidate(items, info, likelies, track_costs)
+    if album_match is not None:
+        results[info.album_id] = album_match
+
 
 def tag_album(
     items,
@@ -499,19 +846,24 @@ def tag_album(
     # The output result, keys are the MB album ID.
     candidates: Dict[Any, AlbumMatch] = {}
 
+    # Track distances shared between the candidates.
+    track_costs: Dict[Tuple[Any, ...], float] = {}
+
     # Search by explicit ID.
     if search_ids:
         for search_id in search_ids:
             log.debug("Searching for album ID: {0}", search_id)
             for album_info_for_id in hooks.albums_for_id(search_id):
-                _add_candidate(items, candidates, album_info_for_id)
+                _add_candidate(
+                    items, candidates, album_info_for_id, likelies, track_costs
+                )
 
     # Use existing metadata or text search.
     else:
         # Try search based on current ID.
         id_info = match_by_id(items)
         if id_info:
-            _add_candidate(items, candidates, id_info)
+            _add_candidate(items, candidates, id_info, likelies, track_costs)
             rec = _recommendation(list(candidates.values()))
             log.debug("Album ID match recommendation is {0}", rec)
             if candidates and not config["import"]["timid"]:
@@ -550,7 +902,9 @@ def tag_album(
         for matched_candidate in hooks.album_candidates(
             items, search_artist, search_album, va_likely, extra_tags
         ):
-            _add_candidate(items, candidates, matched_candidate)
+            _add_candidate(
+                items, candidates, matched_candidate, likelies, track_costs
+            )
 
     log.debug("Evaluating {0} candidates.", len(candidates))
     # Sort and get the recommendation.
@@ -577,6 +931,7 @@ def tag_item(
     # (distance, TrackInfo) pairs.
     candidates = {}
     rec: Optional[Recommendation] = None
+    timid = bool(config["import"]["timid"].get())
 
     # First, try matching by MusicBrainz ID.
     trackids = search_ids or [t for t in [item.mb_trackid] if t]
@@ -589,11 +944,8 @@ def tag_item(
                     dist, track_info
                 )
                 # If this is a good match, then don't keep searching.
-                rec = _recommendation(_sort_candidates(candidates.values()))
-                if (
-                    rec == Recommendation.strong
-                    and not config["import"]["timid"]
-                ):
+                rec = _recommendation(_top_candidates(candidates.values()))
+                if rec == Recommendation.strong and not timid:
                     log.debug("Track ID match.")
                     return Proposal(_sort_candidates(candidates.values()), rec)
 
@@ -362,6 +362,29 @@ def named_queries(model_cls):
     return queries
 
 
+def _overrides(plugin, method_name):
+    """Returns True if `plugin` replaces the default `BeetsPlugin`
+    implementation of the method `method_name`.
+    """
+    return getattr(type(plugin), method_name, None) is not getattr(
+        BeetsPlugin, method_name
+    )
+
+
+def has_track_distance():
+    """Returns True if any loaded plugin contributes to the track
+    distance. Callers can skip `track_distance` otherwise.
+    """
+    return any(_overrides(p, "track_distance") for p in find_plugins())
+
+
+def has_album_distance():
+    """Returns True if any loaded plugin contributes to the album
+    distance. Callers can skip `album_distance` otherwise.
+    """
+    return any(_overrides(p, "album_distance") for p in find_plugins())
+
+
 def track_distance(item, info):
     """Gets the track distance calculated by all loaded plugins.
     Returns a Distance object.
@@ -29,6 +29,7 @@ import beets.library  # noqa: E402
 import beetsplug  # noqa: E402
 from beets import util  # noqa: E402
 from beets import importer, logging  # noqa: E402
+from beets.autotag import match  # noqa: E402
 from beets.ui import commands  # noqa: E402
 from beets.util import bytestring_path, syspath  # noqa: E402
 
@@ -204,6 +205,7 @@ class TestCase(unittest.TestCase, Assertions):
         # A "clean" source list including only the defaults.
         beets.config.sources = []
         beets.config.read(user=False, defaults=True)
+        match._reset_config_cache()
 
         # Direct paths to a temporary directory. Tests can also use this
         # temporary directory.
@@ -176,6 +176,7 @@ class TestHelper:
         self.config["verbose"] = 1
         self.config["ui"]["color"] = False
         self.config["threaded"] = False
+        autotag.match._reset_config_cache()
 
         self.libdir = os.path.join(self.temp_dir, b"libdir")
         os.mkdir(syspath(self.libdir))
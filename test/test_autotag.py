@@ -17,6 +17,7 @@
 
 import re
 import unittest
+from unittest.mock import patch
 
 from beets import autotag, config
 from beets.autotag import AlbumInfo, TrackInfo, match
@@ -381,6 +382,27 @@ class AlbumDistanceTest(_common.TestCase):
         )
         self.assertEqual(self._dist(items, info), 0)
 
+    def test_precomputed_likelies(self):
+        items = []
+        items.append(_make_item("one", 1))
+        items.append(_make_item("two", 2))
+        items.append(_make_item("three", 3))
+        info = AlbumInfo(
+            artist="some artist",
+            album="some album",
+            tracks=_make_trackinfo(),
+            va=False,
+        )
+        mapping = self._mapping(items, info)
+        self.assertEqual(match.distance(items, info, mapping), 0)
+
+        # The precomputed metadata is used instead of the items' own.
+        likelies, _ = match.current_metadata(items)
+        likelies["album"] = "other album"
+        dist = match.distance(items, info, mapping, likelies)
+        self.assertNotEqual(dist, 0)
+        self.assertIn("album", dist.keys())
+
     def test_incomplete_album(self):
         items = []
         items.append(_make_item("one", 1))
@@ -652,6 +674,154 @@ class AssignmentTest(unittest.TestCase):
         for item, info in mapping.items():
             self.assertEqual(items.index(item), trackinfo.index(info))
 
+    def test_aligned_items_skip_cost_matrix(self):
+        items = []
+        items.append(self.item("Two", 2))
+        items.append(self.item("One", 1))
+        trackinfo = []
+        trackinfo.append(TrackInfo(title="one", index=1))
+        trackinfo.append(TrackInfo(title="two", index=2))
+        with patch.object(match, "_build_cost_matrix") as build:
+            mapping, extra_items, extra_tracks = match.assign_items(
+                items, trackinfo
+            )
+        build.assert_not_called()
+        self.assertEqual(extra_items, [])
+        self.assertEqual(extra_tracks, [])
+        self.assertEqual(
+            mapping,
+            {
+                items[0]: trackinfo[1],
+                items[1]: trackinfo[0],
+            },
+        )
+
+    def test_aligned_items_with_other_track_ids_are_solved(self):
+        items = [self.item("A", 1), self.item("B", 2)]
+        items[0].mb_trackid = "id-b"
+        items[1].mb_trackid = "id-a"
+        trackinfo = [
+            TrackInfo(title="A", index=1, track_id="id-a"),
+            TrackInfo(title="B", index=2, track_id="id-b"),
+        ]
+        self.assertIsNone(match._aligned_mapping(items, trackinfo))
+        mapping, _, _ = match.assign_items(items, trackinfo)
+        self.assertEqual(
+            mapping,
+            {
+                items[0]: trackinfo[1],
+                items[1]: trackinfo[0],
+            },
+        )
+
+    def test_aligned_duplicate_titles_with_other_lengths_are_solved(self):
+        items = [self.item("Intro", 1), self.item("Intro", 2)]
+        items[0].length = 60.0
+        items[1].length = 300.0
+        trackinfo = [
+            TrackInfo(title="Intro", index=1, length=300.0),
+            TrackInfo(title="Intro", index=2, length=60.0),
+        ]
+        self.assertIsNone(match._aligned_mapping(items, trackinfo))
+        mapping, _, _ = match.assign_items(items, trackinfo)
+        self.assertEqual(
+            mapping,
+            {
+                items[0]: trackinfo[1],
+                items[1]: trackinfo[0],
+            },
+        )
+
+    def test_cost_matrix_runs_plugin_hooks_once_per_pair(self):
+        def plugin_distance(item, info):
+            dist = Distance()
+            dist.add("source", 1.0)
+            return dist
+
+        items = [self.item("one", 1), self.item("two", 2)]
+        trackinfo = [
+            TrackInfo(title="one", index=1),
+            TrackInfo(title="three", index=3),
+        ]
+        with patch.object(
+            match.plugins, "has_track_distance", return_value=True
+        ), patch.object(
+            match.plugins, "track_distance", side_effect=plugin_distance
+        ) as hook:
+            costs = match._build_cost_matrix(items, trackinfo)
+            self.assertEqual(hook.call_count, len(items) * len(trackinfo))
+            for item, row in zip(items, costs):
+                for track, cost in zip(trackinfo, row):
+                    self.assertEqual(
+                        cost, float(match.track_distance(item, track))
+                    )
+
+    def test_cost_matrix_cache(self):
+        items = [self.item("one", 1), self.item("two", 2)]
+        trackinfo = [TrackInfo(title="one", index=1)]
+        cache = {}
+        costs = match._build_cost_matrix(items, trackinfo, cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(sorted(cache.values()), sorted(sum(costs, [])))
+
+        # An identical track on another candidate reuses the cached cost.
+        for key in cache:
+            cache[key] = 0.5
+        other = [TrackInfo(title="one", index=1)]
+        costs = match._build_cost_matrix(items, other, cache)
+        self.assertEqual(costs, [[0.5], [0.5]])
+
+    def test_large_release_uses_approximate_assignment(self):
+        size = 6
+        items = [self.item(f"song {i}", i) for i in range(size, 0, -1)]
+        trackinfo = [
+            TrackInfo(title=f"song {i}", index=i) for i in range(1, size + 2)
+        ]
+        with patch.object(
+            match, "MAX_EXACT_ASSIGNMENT_SIZE", size - 1
+        ), patch.object(match, "Munkres") as munkres:
+            mapping, extra_items, extra_tracks = match.assign_items(
+                items, trackinfo
+            )
+        munkres.assert_not_called()
+        self.assertEqual(extra_items, [])
+        self.assertEqual(extra_tracks, [trackinfo[-1]])
+        for item, info in mapping.items():
+            self.assertEqual(item.title, info.title)
+
+    def test_approximate_assignment_improves_greedy_choice(self):
+        # Picking the cheapest pair first gives 0.5 + 0.6; exchanging
+        # the columns gives the optimum, 0.51 + 0.51.
+        costs = [[0.5, 0.51], [0.51, 0.6]]
+        self.assertEqual(
+            sorted(match._greedy_assignment(costs)), [(0, 1), (1, 0)]
+        )
+
+    def test_cost_matrix_matches_track_distance(self):
+        items = [
+            self.item("one", 1),
+            self.item("two", 2),
+            Item(title="three", track=1, length=250.0, mb_trackid="id3"),
+        ]
+        trackinfo = [
+            TrackInfo(title="one", index=1, length=100.0),
+            TrackInfo(title="two", index=2),
+            TrackInfo(
+                title="Three (live)",
+                index=3,
+                medium_index=1,
+                length=260.0,
+                track_id="id3",
+            ),
+        ]
+        costs = match._build_cost_matrix(items, trackinfo)
+        self.assertEqual(len(costs), len(items))
+        for item, row in zip(items, costs):
+            self.assertEqual(len(row), len(trackinfo))
+            for track, cost in zip(trackinfo, row):
+                self.assertIsInstance(cost, float)
+                self.assertEqual(cost, float(match.track_distance(item, track)))
+
 
 class ApplyTestUtil:
     def _apply(self, info=None, per_disc_numbering=False, artist_credit=False):
@@ -1073,6 +1243,82 @@ class StringDistanceTest(unittest.TestCase):
         self.assertEqual(dist, 0.0)
 
 
+class TopCandidatesTest(unittest.TestCase):
+    def test_top_candidates_are_sorted_prefix(self):
+        candidates = [
+            autotag.TrackMatch(distance, TrackInfo(title=str(distance)))
+            for distance in (0.5, 0.1, 0.9, 0.3)
+        ]
+        self.assertEqual(
+            match._top_candidates(candidates),
+            list(match._sort_candidates(candidates))[:2],
+        )
+        self.assertEqual(len(match._top_candidates(candidates[:1])), 1)
+
+
+class MatchByIdTest(unittest.TestCase):
+    def _match(self, *albumids):
+        items = [Item(mb_albumid=albumid) for albumid in albumids]
+        with patch.object(match.hooks, "album_for_mbid") as album_for_mbid:
+            album_for_mbid.side_effect = lambda albumid: albumid
+            return match.match_by_id(items)
+
+    def test_consensus(self):
+        self.assertEqual(self._match("id", "", "id"), "id")
+
+    def test_no_album_id(self):
+        self.assertIsNone(self._match("", ""))
+
+    def test_no_consensus(self):
+        self.assertIsNone(self._match("id", "other"))
+
+
+class RecommendationTest(_common.TestCase):
+    def _match(self, key, dist):
+        distance = Distance()
+        distance.add(key, dist)
+        return autotag.TrackMatch(distance, TrackInfo(title="title"))
+
+    def test_strong_recommendation(self):
+        rec = match._recommendation([self._match("track_title", 0.02)])
+        self.assertEqual(rec, match.Recommendation.strong)
+
+    def test_max_rec_downgrades_recommendation(self):
+        config["match"]["max_rec"]["track_title"] = "low"
+        match._reset_config_cache()
+        rec = match._recommendation([self._match("track_title", 0.02)])
+        self.assertEqual(rec, match.Recommendation.low)
+
+    def test_unused_invalid_max_rec_is_ignored(self):
+        config["match"]["max_rec"]["track_length"] = "bogus"
+        match._reset_config_cache()
+        rec = match._recommendation([self._match("track_title", 0.02)])
+        self.assertEqual(rec, match.Recommendation.strong)
+
+
+class ConfigCacheTest(_common.TestCase):
+    def test_reset_picks_up_changed_options(self):
+        self.assertEqual(match._track_length_grace(), 10)
+        config["match"]["track_length_grace"] = 5
+        self.assertEqual(match._track_length_grace(), 10)
+        match._reset_config_cache()
+        self.assertEqual(match._track_length_grace(), 5)
+
+    def test_preferred_media_patterns(self):
+        config["match"]["preferred"]["media"] = ["CD", "Vinyl"]
+        match._reset_config_cache()
+        patterns = match._preferred_media_patterns()
+        self.assertEqual(len(patterns), 2)
+        self.assertTrue(patterns[0].match("2xCD"))
+        self.assertFalse(patterns[0].match("Vinyl"))
+
+    def test_prefer_original_year_accepts_non_bool_values(self):
+        for value, expected in ((1, True), ("yes", True), (0, False)):
+            config["match"]["preferred"]["original_year"] = value
+            match._reset_config_cache()
+            self.assertEqual(match._prefer_original_year(), expected)
+
+
 class EnumTest(_common.TestCase):
     """
     Test Enum Subclasses defined in beets.util.enumeration
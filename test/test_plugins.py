@@ -301,6 +301,32 @@ class HelpersTest(unittest.TestCase):
         )
 
 
+class DistanceHookTest(unittest.TestCase, TestHelper):
+    def setUp(self):
+        self.setup_plugin_loader()
+
+    def tearDown(self):
+        self.teardown_plugin_loader()
+        self.teardown_beets()
+
+    def test_default_hooks_are_not_reported(self):
+        class DummyPlugin(plugins.BeetsPlugin):
+            pass
+
+        self.register_plugin(DummyPlugin)
+        self.assertFalse(plugins.has_track_distance())
+        self.assertFalse(plugins.has_album_distance())
+
+    def test_overridden_hook_is_reported(self):
+        class DistancePlugin(plugins.BeetsPlugin):
+            def track_distance(self, item, info):
+                return super().track_distance(item, info)
+
+        self.register_plugin(DistancePlugin)
+        self.assertTrue(plugins.has_track_distance())
+        self.assertFalse(plugins.has_album_distance())
+
+
 class ListenersTest(unittest.TestCase, TestHelper):
     def setUp(self):
         self.setup_plugin_loader()